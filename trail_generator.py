@@ -1,12 +1,25 @@
 import pygame
 import numpy as np
 import sys
+import time
+
+try:
+    from numba import njit
+except ImportError:
+    # Numba is optional; without it the kernels below run as plain Python.
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
 
 # --- Configuration ---
 WINDOW_WIDTH = 800
 WINDOW_HEIGHT = 600
 SIM_AREA_SIZE = 512 # The area for the grid rendering
 FPS = 30
+SIM_FRAME_BUDGET = 0.020 # Seconds of simulation stepping per rendered frame
+HEADLESS_CHUNK = 10000 # Steps per headless generation call between progress updates
+RNG_BATCH = 8192 # Random numbers drawn per refill of the engine's buffers
 
 # --- Colors ---
 COLOR_BG = (25, 25, 40)
@@ -19,6 +32,17 @@ COLOR_BUTTON_HOVER = (100, 100, 120)
 COLOR_AGENT = (239, 68, 68)
 COLOR_TRAIL = (245, 158, 11)
 
+# --- Directions ---
+# Row/column offsets for directions 0-3 (up, right, down, left).
+DR = (-1, 0, 1, 0)
+DC = (0, 1, 0, -1)
+# For each heading, the (row offset, col offset, new heading) of the straight,
+# left and right moves.
+STEP_TABLE = tuple(
+    tuple((DR[nd], DC[nd], nd) for nd in (d, (d - 1) & 3, (d + 1) & 3))
+    for d in range(4)
+)
+
 
 class InputBox:
     """A simple class to handle text input boxes in Pygame."""
@@ -27,6 +51,8 @@ class InputBox:
         self.color = COLOR_INPUT_INACTIVE
         self.text = text
         self.active = False
+        self._txt_surface = None
+        self._last_text = None
 
     def handle_event(self, event):
         if event.type == pygame.MOUSEBUTTONDOWN:
@@ -46,11 +72,104 @@ class InputBox:
                     self.text += event.unicode
 
     def draw(self, screen, font):
-        txt_surface = font.render(self.text, True, COLOR_TEXT)
-        screen.blit(txt_surface, (self.rect.x + 5, self.rect.y + 5))
+        # Only re-render the text when it has changed since the last draw
+        if self._txt_surface is None or self._last_text != self.text:
+            self._txt_surface = font.render(self.text, True, COLOR_TEXT)
+            self._last_text = self.text
+        screen.blit(self._txt_surface, (self.rect.x + 5, self.rect.y + 5))
         pygame.draw.rect(screen, self.color, self.rect, 2)
 
 
+class Checkbox:
+    """A simple on/off toggle box in Pygame."""
+    def __init__(self, x, y, size, checked=False):
+        self.rect = pygame.Rect(x, y, size, size)
+        self.checked = checked
+
+    def handle_event(self, event):
+        if event.type == pygame.MOUSEBUTTONDOWN and self.rect.collidepoint(event.pos):
+            self.checked = not self.checked
+
+    def draw(self, screen):
+        if self.checked:
+            pygame.draw.rect(screen, COLOR_INPUT_ACTIVE, self.rect.inflate(-10, -10))
+        pygame.draw.rect(screen, COLOR_INPUT_INACTIVE, self.rect, 2)
+
+
+@njit(cache=True)
+def _deposit_nb(grid, neighbors, size, r, c):
+    """Marks a trail cell and bumps the trail-neighbor count of its cardinal neighbors."""
+    grid[r, c] = True
+    for i in range(4):
+        nr = r + DR[i]
+        nc = c + DC[i]
+        if 0 <= nr < size and 0 <= nc < size:
+            neighbors[nr, nc] += 1
+
+
+@njit(cache=True)
+def _is_move_valid_nb(grid, neighbors, tr, tc, cr, cc):
+    if grid[tr, tc]:
+        return False
+
+    # The agent's current position is always a cardinal neighbor of the target and
+    # is allowed to hold trail; any other trail neighbor makes the move invalid.
+    return neighbors[tr, tc] == grid[cr, cc]
+
+
+@njit(cache=True)
+def _can_move_nb(grid, neighbors, size, r, c, dr, dc):
+    nr = r + dr
+    nc = c + dc
+
+    # Boundary check. If move is outside the grid, it's invalid.
+    if not (0 <= nr < size and 0 <= nc < size):
+        return False
+    return _is_move_valid_nb(grid, neighbors, nr, nc, r, c)
+
+
+@njit(cache=True)
+def _step_nb(grid, neighbors, size, r, c, d, turn_prob, forget_prob, forget_rand, turn_rand, turn_bit):
+    """Advances the agent one step. Returns (row, col, direction, trapped)."""
+    if forget_rand > forget_prob and not grid[r, c]:
+        _deposit_nb(grid, neighbors, size, r, c)
+
+    (dr_s, dc_s, d_s), (dr_l, dc_l, d_l), (dr_r, dc_r, d_r) = STEP_TABLE[d]
+
+    # Go straight unless a turn is both possible and drawn. If straight is open and
+    # no turn is drawn, the turns don't need checking at all.
+    can_straight = _can_move_nb(grid, neighbors, size, r, c, dr_s, dc_s)
+    if can_straight and turn_rand >= turn_prob:
+        return r + dr_s, c + dc_s, d_s, False
+
+    can_left = _can_move_nb(grid, neighbors, size, r, c, dr_l, dc_l)
+    can_right = _can_move_nb(grid, neighbors, size, r, c, dr_r, dc_r)
+
+    if not (can_straight or can_left or can_right):
+        return r, c, d, True
+
+    # When both turns are open the random bit picks one.
+    if can_straight and not (can_left or can_right):
+        return r + dr_s, c + dc_s, d_s, False
+    elif can_left and (not can_right or turn_bit):
+        return r + dr_l, c + dc_l, d_l, False
+    else:
+        return r + dr_r, c + dc_r, d_r, False
+
+
+@njit(cache=True)
+def _run_nb(grid, neighbors, r, c, d, turn_prob, forget_prob, rands, bits):
+    """Runs up to len(bits) steps. Returns (row, col, direction, trapped, steps)."""
+    size = grid.shape[0]
+    for i in range(bits.shape[0]):
+        r, c, d, trapped = _step_nb(
+            grid, neighbors, size, r, c, d, turn_prob, forget_prob, rands[2 * i], rands[2 * i + 1], bits[i]
+        )
+        if trapped:
+            return r, c, d, True, i + 1
+    return r, c, d, False, bits.shape[0]
+
+
 class TrailGenerator:
     """The core engine for generating the trail."""
     def __init__(self, grid_size, turn_prob, sparsity):
@@ -58,80 +177,97 @@ class TrailGenerator:
         self.turn_prob = turn_prob
         # Sparsity is now the same as forget_probability
         self.forget_prob = sparsity
-        self.np_random = np.random.default_rng()
-
-        self._direction_vectors = {
-            0: np.array([-1, 0]), 1: np.array([0, 1]),
-            2: np.array([1, 0]), 3: np.array([0, -1]),
-        }
-        self._move_to_direction_change = {"straight": 0, "left": -1, "right": 1}
+        self.np_random = np.random.Generator(np.random.PCG64DXSM())
+
+        # Random numbers are drawn in batches and handed out one at a time.
+        # The float buffer is allocated once and refilled in place.
+        self._rand_buf = np.empty(RNG_BATCH, dtype=np.float64)
+        self.np_random.random(out=self._rand_buf)
+        self._rand_idx = 0
+        self._bool_buf = self.np_random.integers(0, 2, RNG_BATCH, dtype=np.int8)
+        self._bool_idx = 0
         
         self.reset()
 
     def reset(self):
-        self.grid = np.zeros((self.size, self.size), dtype=np.uint8)
-        self._agent_location = self.np_random.integers(
-            self.size // 2 - 2, self.size // 2 + 2, size=2, dtype=int
-        )
-        self._agent_direction = self.np_random.integers(0, 4)
+        self.grid = np.zeros((self.size, self.size), dtype=bool)
+        # Number of trail cells among each cell's cardinal neighbors.
+        self._neighbors = np.zeros((self.size, self.size), dtype=np.uint8)
+        self._agent_row = int(self.np_random.integers(self.size // 2 - 2, self.size // 2 + 2))
+        self._agent_col = int(self.np_random.integers(self.size // 2 - 2, self.size // 2 + 2))
+        self._agent_direction = int(self.np_random.integers(0, 4))
         self.is_trapped = False
-
-    def _is_move_valid(self, target_loc, current_loc, grid):
-        if grid[target_loc[0], target_loc[1]] != 0:
-            return False
-        
-        for i in range(4):
-            check_loc = target_loc + self._direction_vectors[i]
-            
-            # It's okay for a neighbor to be the agent's current position.
-            if np.array_equal(check_loc, current_loc):
-                continue
-            
-            # If the neighbor is outside the grid, we don't need to check it.
-            if not (0 <= check_loc[0] < self.size and 0 <= check_loc[1] < self.size):
-                continue
-
-            # If any other cardinal neighbor has a trail, the move is invalid.
-            if grid[check_loc[0], check_loc[1]] != 0:
-                return False
-        return True
+        self.last_deposited = None # (row, col) of the cell marked by the last step
+
+    def _rand(self):
+        if self._rand_idx == RNG_BATCH:
+            self.np_random.random(out=self._rand_buf)
+            self._rand_idx = 0
+        value = self._rand_buf[self._rand_idx]
+        self._rand_idx += 1
+        return value
+
+    def _rand_bit(self):
+        if self._bool_idx == RNG_BATCH:
+            self._bool_buf = self.np_random.integers(0, 2, RNG_BATCH, dtype=np.int8)
+            self._bool_idx = 0
+        value = self._bool_buf[self._bool_idx]
+        self._bool_idx += 1
+        return value
 
     def step(self):
+        self.last_deposited = None
         if self.is_trapped:
             return
 
-        if self.np_random.random() > self.forget_prob:
-            self.grid[self._agent_location[0], self._agent_location[1]] = 1
+        row, col = self._agent_row, self._agent_col
+        self._agent_row, self._agent_col, self._agent_direction, self.is_trapped = _step_nb(
+            self.grid, self._neighbors, self.size, row, col, self._agent_direction,
+            self.turn_prob, self.forget_prob, self._rand(), self._rand(), self._rand_bit()
+        )
+        if self.grid[row, col]:
+            self.last_deposited = (row, col)
 
-        valid_moves = {}
-        for move, d_change in self._move_to_direction_change.items():
-            new_dir = (self._agent_direction + d_change) % 4
-            next_loc = self._agent_location + self._direction_vectors[new_dir]
-            
-            # Boundary check. If move is outside the grid, it's invalid.
-            if not (0 <= next_loc[0] < self.size and 0 <= next_loc[1] < self.size):
-                continue
+    def run(self, n_steps):
+        # Takes up to n_steps steps in one call; returns how many were taken.
+        self.last_deposited = None
+        if self.is_trapped:
+            return 0
 
-            if self._is_move_valid(next_loc, self._agent_location, self.grid):
-                valid_moves[move] = (next_loc, new_dir)
+        rands = self.np_random.random(2 * n_steps)
+        bits = self.np_random.integers(0, 2, n_steps, dtype=np.int8)
+        self._agent_row, self._agent_col, self._agent_direction, self.is_trapped, steps = _run_nb(
+            self.grid, self._neighbors, self._agent_row, self._agent_col, self._agent_direction,
+            self.turn_prob, self.forget_prob, rands, bits
+        )
+        return steps
 
-        if not valid_moves:
-            self.is_trapped = True
-            return
 
-        can_straight = "straight" in valid_moves
-        turns = [m for m in ["left", "right"] if m in valid_moves]
-        can_turn = len(turns) > 0
-        
-        chosen_move = None
-        if can_straight and can_turn:
-            chosen_move = self.np_random.choice(turns) if self.np_random.random() < self.turn_prob else "straight"
-        elif can_turn:
-            chosen_move = self.np_random.choice(turns)
-        else:
-            chosen_move = "straight"
+def _digits(values, width):
+    """Returns the ASCII digits of values, right-aligned in width columns, and a
+    mask that is False on the leading padding."""
+    powers = 10 ** np.arange(width - 1, -1, -1)
+    column = values[:, np.newaxis]
+    keep = column >= powers
+    keep[:, -1] = True # Zero still prints one digit
+    return (column // powers % 10 + ord("0")).astype(np.uint8), keep
 
-        self._agent_location, self._agent_direction = valid_moves[chosen_move]
+
+def _format_coords(xs, ys):
+    """Formats coordinate pairs as b"(x, y)\\n" lines using whole-array NumPy ops."""
+    width = len(str(max(xs.max(initial=0), ys.max(initial=0))))
+    chars = np.empty((len(xs), 2 * width + 5), dtype=np.uint8)
+    keep = np.ones(chars.shape, dtype=bool)
+
+    x_start, y_start = 1, width + 3
+    chars[:, 0] = ord("(")
+    chars[:, x_start:x_start + width], keep[:, x_start:x_start + width] = _digits(xs, width)
+    chars[:, y_start - 2] = ord(",")
+    chars[:, y_start - 1] = ord(" ")
+    chars[:, y_start:y_start + width], keep[:, y_start:y_start + width] = _digits(ys, width)
+    chars[:, -2] = ord(")")
+    chars[:, -1] = ord("\n")
+    return chars[keep].tobytes()
 
 
 class App:
@@ -140,18 +276,47 @@ class App:
         pygame.init()
         self.screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
         pygame.display.set_caption("Trail Generation Tool")
+        # The UI only reacts to these (TEXTINPUT feeds KEYDOWN's unicode); don't
+        # queue mouse motion and the like
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed([pygame.QUIT, pygame.MOUSEBUTTONDOWN, pygame.KEYDOWN, pygame.TEXTINPUT])
         self.clock = pygame.time.Clock()
         self.font_small = pygame.font.Font(None, 24)
         self.font_large = pygame.font.Font(None, 32)
+        self._render_static_text()
         
-        self.state = "INPUT" # INPUT, SIMULATING, FINISHED
+        self.state = "INPUT" # INPUT, SIMULATING, GENERATING, FINISHED
         self.trail_engine = None
         self.trail_name = ""
         self.last_params = {} # Store last used parameters
         self.step_count = 0
         self.max_steps = 0
+        self.steps_per_frame = 1
+        self._trail_surface = None
+        # Layout and surfaces that are the same every frame
+        self.grid_rect = pygame.Rect((WINDOW_WIDTH - SIM_AREA_SIZE) // 2, (WINDOW_HEIGHT - SIM_AREA_SIZE) // 2, SIM_AREA_SIZE, SIM_AREA_SIZE)
+        self._overlay_surf = pygame.Surface((250, 200), pygame.SRCALPHA)
+        self._overlay_surf.fill((40, 40, 60, 220))
         self._setup_input_ui()
 
+    def _render_static_text(self):
+        # Titles, labels and button captions never change, so render them once
+        self._input_title_surf = self.font_large.render("Trail Generator Settings", True, COLOR_TEXT)
+        labels = {
+            "name": "Trail Name:", 
+            "size": "Grid Size:", 
+            "tortuosity": "Tortuosity (0-1):", 
+            "sparsity": "Sparsity (0-1):",
+            "length": "Trail Length (0=max):"
+        }
+        self._label_surfs = {name: self.font_small.render(label, True, COLOR_TEXT) for name, label in labels.items()}
+        self._skip_animation_label_surf = self.font_small.render("Skip Animation:", True, COLOR_TEXT)
+        self._generate_text_surf = self.font_large.render("Generate Trail", True, COLOR_TEXT)
+        self._generating_title_surf = self.font_large.render("Generating Trail...", True, COLOR_TEXT)
+        self._finished_title_surf = self.font_large.render("Generation Finished", True, COLOR_TEXT)
+        self._save_text_surf = self.font_large.render("Save Trail", True, COLOR_TEXT)
+        self._restart_text_surf = self.font_large.render("Restart", True, COLOR_TEXT)
+
     def _setup_input_ui(self):
         # Use last parameters if they exist, otherwise start blank
         self.input_boxes = {
@@ -161,7 +326,8 @@ class App:
             "sparsity": InputBox(300, 300, 140, 32, self.last_params.get("sparsity", "")),
             "length": InputBox(300, 350, 140, 32, self.last_params.get("length", "0")),
         }
-        self.generate_button_rect = pygame.Rect(300, 400, 200, 40)
+        self.skip_animation_box = Checkbox(300, 400, 32, self.last_params.get("skip_animation", False))
+        self.generate_button_rect = pygame.Rect(300, 450, 200, 40)
 
     def _setup_finished_ui(self):
         self.save_button_rect = pygame.Rect(WINDOW_WIDTH - 220, 100, 200, 40)
@@ -170,26 +336,26 @@ class App:
     def run(self):
         running = True
         while running:
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
+            if self.state == "SIMULATING" or self.state == "GENERATING":
+                # Only quitting matters while the trail is being built, so check for it
+                # and discard everything else without dispatching it.
+                if pygame.event.peek(pygame.QUIT):
                     running = False
-                
-                if self.state == "INPUT":
-                    self.handle_input_events(event)
-                elif self.state == "FINISHED":
-                    self.handle_finished_events(event)
+                pygame.event.clear()
+            else:
+                for event in pygame.event.get():
+                    if event.type == pygame.QUIT:
+                        running = False
+                    
+                    if self.state == "INPUT":
+                        self.handle_input_events(event)
+                    elif self.state == "FINISHED":
+                        self.handle_finished_events(event)
 
             if self.state == "SIMULATING":
-                self.trail_engine.step()
-                self.step_count += 1
-                
-                # Check for termination conditions
-                is_finished = self.trail_engine.is_trapped or \
-                              (self.max_steps > 0 and self.step_count >= self.max_steps)
-                
-                if is_finished:
-                    self.state = "FINISHED"
-                    self._setup_finished_ui()
+                self.simulate_frame()
+            elif self.state == "GENERATING":
+                self.generate_frame()
 
             self.draw()
             self.clock.tick(FPS)
@@ -197,9 +363,62 @@ class App:
         pygame.quit()
         sys.exit()
 
+    def simulate_frame(self):
+        engine = self.trail_engine
+        start = time.perf_counter()
+        is_finished = False
+        for _ in range(self.steps_per_frame):
+            engine.step()
+            self.step_count += 1
+            if engine.last_deposited:
+                r, c = engine.last_deposited
+                self._trail_surface.set_at((c, r), COLOR_TRAIL)
+
+            # Check for termination conditions
+            is_finished = engine.is_trapped or \
+                          (self.max_steps > 0 and self.step_count >= self.max_steps)
+            if is_finished:
+                break
+
+        if is_finished:
+            self.state = "FINISHED"
+            self._setup_finished_ui()
+            return
+
+        # Adapt the batch size so stepping fills, but doesn't overrun, the frame budget.
+        elapsed = time.perf_counter() - start
+        if elapsed < SIM_FRAME_BUDGET:
+            self.steps_per_frame *= 2
+        elif elapsed > 2 * SIM_FRAME_BUDGET and self.steps_per_frame > 1:
+            self.steps_per_frame //= 2
+
+    def generate_frame(self):
+        # Headless generation: run chunks until the frame budget is spent, then
+        # return so the progress display can be redrawn.
+        engine = self.trail_engine
+        start = time.perf_counter()
+        while time.perf_counter() - start < SIM_FRAME_BUDGET:
+            chunk = HEADLESS_CHUNK
+            if self.max_steps > 0:
+                chunk = min(chunk, self.max_steps - self.step_count)
+            self.step_count += engine.run(chunk)
+
+            if engine.is_trapped or (self.max_steps > 0 and self.step_count >= self.max_steps):
+                self._sync_trail_surface()
+                self.state = "FINISHED"
+                self._setup_finished_ui()
+                return
+
+    def _sync_trail_surface(self):
+        # Rebuild the cached trail surface from the whole grid, indexed (x, y) for surfarray
+        grid = self.trail_engine.grid.T[:, :, np.newaxis]
+        img = np.where(grid, COLOR_TRAIL, COLOR_GRID_BG).astype(np.uint8)
+        self._trail_surface = pygame.surfarray.make_surface(img)
+
     def handle_input_events(self, event):
         for box in self.input_boxes.values():
             box.handle_event(event)
+        self.skip_animation_box.handle_event(event)
         
         if event.type == pygame.MOUSEBUTTONDOWN:
             if self.generate_button_rect.collidepoint(event.pos):
@@ -222,6 +441,7 @@ class App:
                 "tortuosity": self.input_boxes["tortuosity"].text,
                 "sparsity": self.input_boxes["sparsity"].text,
                 "length": self.input_boxes["length"].text,
+                "skip_animation": self.skip_animation_box.checked,
             }
             
             self.trail_name = self.last_params["name"] or "untitled_trail"
@@ -238,8 +458,14 @@ class App:
             
             self.max_steps = trail_length
             self.step_count = 0
+            self.steps_per_frame = 1
             self.trail_engine = TrailGenerator(grid_size, tortuosity, sparsity)
-            self.state = "SIMULATING"
+            self._trail_surface = pygame.Surface((grid_size, grid_size))
+            self._trail_surface.fill(COLOR_GRID_BG)
+            # A fixed-length trail is always generated headless; one that runs until
+            # trapped is animated unless the user chose to skip the animation
+            headless = trail_length > 0 or self.last_params["skip_animation"]
+            self.state = "GENERATING" if headless else "SIMULATING"
         except (ValueError, TypeError) as e:
             print(f"Error parsing input: {e}. Please ensure numbers are entered correctly.")
             self.state = "INPUT" # Go back to input screen on error
@@ -249,16 +475,13 @@ class App:
             return
         
         filename = f"{self.trail_name}.txt"
-        coordinates = []
-        for r in range(self.trail_engine.size):
-            for c in range(self.trail_engine.size):
-                if self.trail_engine.grid[r, c] == 1:
-                    # Save as (x, y) which corresponds to (column, row)
-                    coordinates.append(f"({c}, {r})\n")
+        rows, cols = np.nonzero(self.trail_engine.grid)
+        # Save as (x, y) which corresponds to (column, row)
+        body = _format_coords(cols, rows)
         
         try:
-            with open(filename, "w") as f:
-                f.writelines(coordinates)
+            with open(filename, "wb") as f:
+                f.write(body)
             print(f"Trail saved successfully to {filename}")
         except IOError as e:
             print(f"Error saving file: {e}")
@@ -272,73 +495,84 @@ class App:
             self.draw_simulation_screen()
             if self.state == "FINISHED":
                 self.draw_finished_screen()
+        elif self.state == "GENERATING":
+            self.draw_progress_screen()
         pygame.display.flip()
 
     def draw_input_screen(self):
         # Title
-        title_surf = self.font_large.render("Trail Generator Settings", True, COLOR_TEXT)
+        title_surf = self._input_title_surf
         self.screen.blit(title_surf, (WINDOW_WIDTH // 2 - title_surf.get_width() // 2, 80))
 
         # Labels and boxes
-        labels = {
-            "name": "Trail Name:", 
-            "size": "Grid Size:", 
-            "tortuosity": "Tortuosity (0-1):", 
-            "sparsity": "Sparsity (0-1):",
-            "length": "Trail Length (0=max):"
-        }
         for name, box in self.input_boxes.items():
-            label_surf = self.font_small.render(labels[name], True, COLOR_TEXT)
+            label_surf = self._label_surfs[name]
             self.screen.blit(label_surf, (box.rect.x - label_surf.get_width() - 10, box.rect.y + 5))
             box.draw(self.screen, self.font_large)
 
+        label_surf = self._skip_animation_label_surf
+        box_rect = self.skip_animation_box.rect
+        self.screen.blit(label_surf, (box_rect.x - label_surf.get_width() - 10, box_rect.y + 5))
+        self.skip_animation_box.draw(self.screen)
+
         # Generate Button
         mouse_pos = pygame.mouse.get_pos()
         button_color = COLOR_BUTTON_HOVER if self.generate_button_rect.collidepoint(mouse_pos) else COLOR_BUTTON
         pygame.draw.rect(self.screen, button_color, self.generate_button_rect, border_radius=5)
-        btn_text = self.font_large.render("Generate Trail", True, COLOR_TEXT)
+        btn_text = self._generate_text_surf
         self.screen.blit(btn_text, (self.generate_button_rect.centerx - btn_text.get_width() // 2, self.generate_button_rect.centery - btn_text.get_height() // 2))
 
     def draw_simulation_screen(self):
-        # Draw grid background
-        grid_rect = pygame.Rect((WINDOW_WIDTH - SIM_AREA_SIZE) // 2, (WINDOW_HEIGHT - SIM_AREA_SIZE) // 2, SIM_AREA_SIZE, SIM_AREA_SIZE)
-        pygame.draw.rect(self.screen, COLOR_GRID_BG, grid_rect)
+        grid_rect = self.grid_rect
         
         engine = self.trail_engine
         pix_size = SIM_AREA_SIZE / engine.size
 
-        # Draw trail and agent
-        for r in range(engine.size):
-            for c in range(engine.size):
-                if engine.grid[r, c] == 1:
-                    pygame.draw.rect(self.screen, COLOR_TRAIL, pygame.Rect(grid_rect.x + c * pix_size, grid_rect.y + r * pix_size, pix_size, pix_size))
+        # Draw grid background and trail, kept up to date one cell at a time
+        self.screen.blit(pygame.transform.scale(self._trail_surface, grid_rect.size), grid_rect.topleft)
         
         # Draw agent on top
-        agent_x = grid_rect.x + (engine._agent_location[1] + 0.5) * pix_size
-        agent_y = grid_rect.y + (engine._agent_location[0] + 0.5) * pix_size
+        agent_x = grid_rect.x + (engine._agent_col + 0.5) * pix_size
+        agent_y = grid_rect.y + (engine._agent_row + 0.5) * pix_size
         pygame.draw.circle(self.screen, COLOR_AGENT, (agent_x, agent_y), pix_size / 2)
 
+    def draw_progress_screen(self):
+        # Title
+        title_surf = self._generating_title_surf
+        self.screen.blit(title_surf, (WINDOW_WIDTH // 2 - title_surf.get_width() // 2, 250))
+
+        # Without a target length there's no progress to show, only the step count
+        if self.max_steps == 0:
+            count_surf = self.font_small.render(f"{self.step_count} steps", True, COLOR_TEXT)
+            self.screen.blit(count_surf, (WINDOW_WIDTH // 2 - count_surf.get_width() // 2, 295))
+            return
+
+        # Progress bar
+        bar_rect = pygame.Rect(WINDOW_WIDTH // 2 - 200, 290, 400, 30)
+        fill_rect = bar_rect.copy()
+        fill_rect.width = int(bar_rect.width * min(self.step_count / self.max_steps, 1))
+        pygame.draw.rect(self.screen, COLOR_TRAIL, fill_rect, border_radius=5)
+        pygame.draw.rect(self.screen, COLOR_INPUT_INACTIVE, bar_rect, 2, border_radius=5)
+
     def draw_finished_screen(self):
         # Overlay with options
-        overlay = pygame.Surface((250, 200), pygame.SRCALPHA)
-        overlay.fill((40, 40, 60, 220))
-        self.screen.blit(overlay, (WINDOW_WIDTH - 260, 50))
+        self.screen.blit(self._overlay_surf, (WINDOW_WIDTH - 260, 50))
 
         # Title
-        title_surf = self.font_large.render("Generation Finished", True, COLOR_TEXT)
+        title_surf = self._finished_title_surf
         self.screen.blit(title_surf, (WINDOW_WIDTH - 250, 60))
 
         # Save Button
         mouse_pos = pygame.mouse.get_pos()
         save_color = COLOR_BUTTON_HOVER if self.save_button_rect.collidepoint(mouse_pos) else COLOR_BUTTON
         pygame.draw.rect(self.screen, save_color, self.save_button_rect, border_radius=5)
-        save_text = self.font_large.render("Save Trail", True, COLOR_TEXT)
+        save_text = self._save_text_surf
         self.screen.blit(save_text, (self.save_button_rect.centerx - save_text.get_width() // 2, self.save_button_rect.centery - save_text.get_height() // 2))
 
         # Restart Button
         restart_color = COLOR_BUTTON_HOVER if self.restart_button_rect.collidepoint(mouse_pos) else COLOR_BUTTON
         pygame.draw.rect(self.screen, restart_color, self.restart_button_rect, border_radius=5)
-        restart_text = self.font_large.render("Restart", True, COLOR_TEXT)
+        restart_text = self._restart_text_surf
         self.screen.blit(restart_text, (self.restart_button_rect.centerx - restart_text.get_width() // 2, self.restart_button_rect.centery - restart_text.get_height() // 2))
 
 